@@ -7,33 +7,55 @@ import yaml
 import subprocess
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, Any, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 import functools
 from enum import Enum
 from dataclasses import dataclass, field
 import signal
+import struct
+import re
 import jsonschema
 import atexit
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder; fall back to the stdlib parser
+    orjson = None
+
 # Constants
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 DEFAULT_TIMEOUT = 5
 MAX_RETRIES = 3
 RETRY_DELAY = 5
 STARTUP_DELAY = 60  # Default startup delay in seconds
+SUSPEND_COMMAND_TIMEOUT = 30  # Timeout for wake timer and suspend commands in seconds
+HTTP_POOL_CONNECTIONS = 8  # One connection pool per monitored HTTP service
+HTTP_POOL_MAXSIZE = 4  # Default connections kept per service host
+NEXTCLOUD_CPU_THRESHOLD = 0.5  # Default 5-minute load average treated as activity
 
 # System command paths for security
 SYSTEM_COMMANDS = {
     'who': '/usr/bin/who',
-    'sync': '/bin/sync',
     'systemctl': '/bin/systemctl',
     'set_wakeup': '/usr/local/bin/set-wakeup.sh'
 }
 
+# Fixed argument vectors for the suspend sequence, built once
+SET_WAKEUP_ARGV = ('sudo', SYSTEM_COMMANDS['set_wakeup'])
+SUSPEND_ARGV = ('sudo', SYSTEM_COMMANDS['systemctl'], 'suspend')
+
+# Login records (see utmp(5)); read directly instead of spawning `who`
+UTMP_FILE = '/var/run/utmp'
+UTMP_USER_PROCESS = 7  # ut_type of a normal user login
+UTMP_RECORD = struct.Struct('hi32s4s32s256shhiii4i20s')  # glibc struct utmp, 384 bytes
+WHO_USER_PATTERN = re.compile(rb'^(\S+)', re.MULTILINE)  # First column of each `who` line
+
 # Configuration schema for validation
 CONFIG_SCHEMA = {
     "type": "object",
@@ -46,6 +68,8 @@ CONFIG_SCHEMA = {
                 "check_interval": {"type": "integer", "minimum": 1},
                 "grace_period": {"type": "integer", "minimum": 1},
                 "grace_period_check_interval": {"type": "integer", "minimum": 1},
+                "max_check_interval": {"type": "integer", "minimum": 1},
+                "check_timeout": {"type": "integer", "minimum": 1},
                 "max_retries": {"type": "integer", "minimum": 1},
                 "retry_delay": {"type": "integer", "minimum": 1}
             }
@@ -109,7 +133,8 @@ CONFIG_SCHEMA = {
                 "enabled": {"type": "boolean"},
                 "url": {"type": "string", "format": "uri"},
                 "token": {"type": "string"},
-                "timeout": {"type": "integer", "minimum": 1}
+                "timeout": {"type": "integer", "minimum": 1},
+                "cpu_threshold": {"type": "number", "minimum": 0}
             }
         },
         "raspberry_pi": {
@@ -125,10 +150,110 @@ CONFIG_SCHEMA = {
             "properties": {
                 "enabled": {"type": "boolean"}
             }
+        },
+        "suspend": {
+            "type": "object",
+            "properties": {
+                "minimum_uptime": {"type": "integer", "minimum": 0}
+            }
+        },
+        "network": {
+            "type": "object",
+            "properties": {
+                "timeout": {"type": "integer", "minimum": 1},
+                "max_retries": {"type": "integer", "minimum": 0},
+                "http_pool_maxsize": {"type": "integer", "minimum": 1}
+            }
         }
     }
 }
 
+def mount_http_adapter(session: requests.Session, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> None:
+    """Mounts a connection-pooling adapter on the session for HTTP and HTTPS.
+
+    Each service host gets its own pool of at most pool_maxsize connections.
+    pool_block makes a burst of requests wait for a pooled connection
+    instead of opening and discarding extra sockets. Any adapters already
+    mounted for these prefixes are closed first so their pooled sockets
+    are released.
+
+    Args:
+        session (requests.Session): Session to mount the adapter on.
+        pool_maxsize (int): Maximum connections kept per host.
+    """
+    for prefix in ('http://', 'https://'):
+        previous = session.adapters.get(prefix)
+        if previous is not None:
+            previous.close()
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        pool_block=True
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+
+def create_http_session() -> requests.Session:
+    """Creates the HTTP session shared by all service checks.
+
+    Reusing one session keeps connections to each service alive between
+    polls instead of opening a new TCP (and TLS) connection per request.
+    Retries are left to the api_request decorator.
+
+    Returns:
+        requests.Session: Session with a pooled adapter mounted for HTTP and HTTPS.
+    """
+    session = requests.Session()
+    mount_http_adapter(session)
+    session.headers['User-Agent'] = 'mediaserver-autosuspend'
+    return session
+
+
+HTTP_SESSION = create_http_session()
+atexit.register(HTTP_SESSION.close)
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Decodes a JSON response body, using orjson when it is installed.
+
+    Args:
+        response (requests.Response): The HTTP response to decode.
+
+    Returns:
+        Any: The decoded JSON document.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Set to cut the main loop's current wait short (e.g. after a config reload)
+_wakeup_event = threading.Event()
+
+
+def interruptible_sleep(seconds: float) -> bool:
+    """Waits for the given time unless the main loop is woken up earlier.
+
+    Args:
+        seconds (float): Maximum time to wait in seconds.
+
+    Returns:
+        bool: True if the wait was cut short by wake_main_loop(), False on timeout.
+    """
+    woken = _wakeup_event.wait(timeout=max(0.0, seconds))
+    _wakeup_event.clear()
+    return woken
+
+
+def wake_main_loop() -> None:
+    """Wakes the main loop so it re-evaluates service activity immediately."""
+    _wakeup_event.set()
+
+
 class APICache:
     """Cache for API results to reduce redundant calls."""
     
@@ -154,7 +279,7 @@ class APICache:
         with self._lock:
             if key in self._cache:
                 value, timestamp = self._cache[key]
-                if time.time() - timestamp <= self._cache_ttl:
+                if time.monotonic() - timestamp <= self._cache_ttl:
                     return value
                 del self._cache[key]
             return None
@@ -167,7 +292,7 @@ class APICache:
             value (Any): Value to cache.
         """
         with self._lock:
-            self._cache[key] = (value, time.time())
+            self._cache[key] = (value, time.monotonic())
             
     def clear(self) -> None:
         """Clear all cached values."""
@@ -177,6 +302,11 @@ class APICache:
 
 def cached_api_request(cache_key: str, cache_ttl: int = 30):
     """Decorator to cache API request results.
+
+    The wrapped function accepts an extra keyword-only ``fresh`` argument.
+    When True, the cache is bypassed and the result of a new request
+    replaces the cached entry; use it for suspend decisions that must not
+    act on stale data.
     
     Args:
         cache_key (str): Base key for the cache entry.
@@ -187,17 +317,20 @@ def cached_api_request(cache_key: str, cache_ttl: int = 30):
         cache = APICache(cache_ttl=cache_ttl)
         
         @functools.wraps(func)
-        def wrapper(config: Config, logger: logging.Logger, *args, **kwargs):
+        def wrapper(config: Config, logger: logging.Logger, *args, fresh: bool = False, **kwargs):
             # Generate a unique cache key including any relevant args
             full_cache_key = f"{cache_key}:{hash(str(args))}{hash(str(kwargs))}"
             
             # Try to get from cache first
-            cached_result = cache.get(full_cache_key)
-            if cached_result is not None:
-                logger.debug(f"Using cached result for {func.__name__}")
-                return cached_result
+            if not fresh:
+                cached_result = cache.get(full_cache_key)
+                if cached_result is not None:
+                    # Skip building the message on every cache hit unless debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Using cached result for {func.__name__}")
+                    return cached_result
                 
-            # If not in cache, call the function and cache the result
+            # If not in cache (or a fresh result was requested), call the function and cache the result
             result = func(config, logger, *args, **kwargs)
             cache.set(full_cache_key, result)
             return result
@@ -438,6 +571,54 @@ class Config:
             if key not in self._cache:
                 self._cache[key] = getter_func()
             return self._cache[key]
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Maximum number of pooled HTTP connections kept per service host."""
+        return self._get_cached_value(
+            'http_pool_maxsize',
+            lambda: self.config.get('network', {}).get('http_pool_maxsize', HTTP_POOL_MAXSIZE)
+        )
+
+    @property
+    def nextcloud_cpu_threshold(self) -> float:
+        """Nextcloud 5-minute load average above which the server counts as active."""
+        return self._get_cached_value(
+            'nextcloud_cpu_threshold',
+            lambda: float(self.config.get('nextcloud', {}).get('cpu_threshold', NEXTCLOUD_CPU_THRESHOLD))
+        )
+
+    @property
+    def check_timeout(self) -> Optional[int]:
+        """Upper bound in seconds on one round of service checks, or None for no limit."""
+        return self._get_cached_value(
+            'check_timeout',
+            lambda: self.config['monitoring'].get('check_timeout')
+        )
+
+    @property
+    def minimum_uptime(self) -> int:
+        """Seconds the system must be up before suspending is considered."""
+        return self._get_cached_value(
+            'minimum_uptime',
+            lambda: self.config.get('suspend', {}).get('minimum_uptime', 0)
+        )
+
+    @property
+    def max_check_interval(self) -> int:
+        """Longest interval the main loop backs off to while activity persists.
+
+        Defaults to check_interval, which disables the back-off. Values below
+        check_interval are raised to it so the back-off never polls faster.
+        """
+        monitoring = self.config['monitoring']
+        return self._get_cached_value(
+            'max_check_interval',
+            lambda: max(
+                monitoring['check_interval'],
+                monitoring.get('max_check_interval', monitoring['check_interval'])
+            )
+        )
         
 def api_request(func):
     """Decorator to handle API request retries and common exceptions."""
@@ -498,14 +679,14 @@ def check_jellyfin(config: Config, logger: logging.Logger) -> bool:
     headers = {
         'X-Emby-Authorization': f'MediaBrowser ClientId="JellyfinWeb", DeviceId="", Device="", Version="", Token="{config.jellyfin_api_key}"'
     }
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f"{config.jellyfin_url}/Sessions",
         headers=headers,
         timeout=config.jellyfin_timeout,
         verify=True  # Enable SSL verification
     )
     response.raise_for_status()
-    sessions = response.json()
+    sessions = parse_json_response(response)
 
     if not isinstance(sessions, list):
         logger.error(f"{service_name}: Unexpected response format (not a list)")
@@ -555,7 +736,7 @@ def check_sonarr(config: Config, logger: logging.Logger) -> bool:
         return False
 
     headers = {'X-Api-Key': config.sonarr_api_key}
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f'{config.sonarr_url}/api/v3/queue',
         headers=headers,
         timeout=config.sonarr_timeout,
@@ -563,7 +744,7 @@ def check_sonarr(config: Config, logger: logging.Logger) -> bool:
     )
     response.raise_for_status()
 
-    data = response.json()
+    data = parse_json_response(response)
     if not isinstance(data, dict):
         logger.error(f"{service_name}: Unexpected response format (not a dictionary)")
         config.activity_history.add_entry(ActivityCheckResult(
@@ -613,7 +794,7 @@ def check_radarr(config: Config, logger: logging.Logger) -> bool:
         return False
 
     headers = {'X-Api-Key': config.radarr_api_key}
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f'{config.radarr_url}/api/v3/queue',
         headers=headers,
         timeout=config.radarr_timeout,
@@ -621,7 +802,7 @@ def check_radarr(config: Config, logger: logging.Logger) -> bool:
     )
     response.raise_for_status()
 
-    data = response.json()
+    data = parse_json_response(response)
     if not isinstance(data, dict):
         logger.error(f"{service_name}: Unexpected response format (not a dictionary)")
         config.activity_history.add_entry(ActivityCheckResult(
@@ -675,14 +856,14 @@ def check_nextcloud(config: Config, logger: logging.Logger) -> bool:
         'NC-Token': config.nextcloud_token,
         'OCS-APIRequest': 'true'
     }
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f"{config.nextcloud_url}/ocs/v2.php/apps/serverinfo/api/v1/info?format=json",
         headers=headers,
         timeout=config.nextcloud_timeout,
         verify=True
     )
     response.raise_for_status()
-    data = response.json()
+    data = parse_json_response(response)
 
     # Validate response structure using a more robust approach
     try:
@@ -696,9 +877,7 @@ def check_nextcloud(config: Config, logger: logging.Logger) -> bool:
         ))
         return False
 
-    # Configure threshold through config if needed
-    cpu_threshold = 0.5  # Could be made configurable
-    if cpu_load > cpu_threshold:
+    if cpu_load > config.nextcloud_cpu_threshold:
         logger.info(f"{service_name}: High CPU load detected (Load average: {cpu_load:.2f})")
         config.activity_history.add_entry(ActivityCheckResult(
             service_name=service_name,
@@ -737,7 +916,7 @@ def check_raspberry_pi_activity(config: Config, logger: logging.Logger) -> bool:
         ))
         return False
 
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f'{config.raspberry_pi_url}/check-activity',
         timeout=config.raspberry_pi_timeout,
         verify=True
@@ -745,7 +924,7 @@ def check_raspberry_pi_activity(config: Config, logger: logging.Logger) -> bool:
     response.raise_for_status()
 
     try:
-        activity_data = response.json()
+        activity_data = parse_json_response(response)
         if not isinstance(activity_data, dict):
             raise ValueError("Response is not a dictionary")
             
@@ -802,7 +981,7 @@ def check_plex(config: Config, logger: logging.Logger) -> bool:
         return False
 
     headers = {'X-Plex-Token': config.plex_token}
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f"{config.plex_url}/status/sessions",
         headers=headers,
         timeout=config.plex_timeout,
@@ -879,7 +1058,7 @@ def check_emby(config: Config, logger: logging.Logger) -> bool:
         return False
 
     headers = {'X-Emby-Token': config.emby_api_key}
-    response = requests.get(
+    response = HTTP_SESSION.get(
         f"{config.emby_url}/emby/Sessions",
         headers=headers,
         timeout=config.emby_timeout,
@@ -888,7 +1067,7 @@ def check_emby(config: Config, logger: logging.Logger) -> bool:
     response.raise_for_status()
     
     try:
-        sessions = response.json()
+        sessions = parse_json_response(response)
         if not isinstance(sessions, list):
             raise ValueError("Unexpected response format (not a list)")
 
@@ -931,6 +1110,32 @@ def check_emby(config: Config, logger: logging.Logger) -> bool:
         return False
 
 
+def read_logged_in_users() -> List[str]:
+    """Reads the names of logged-in users from the utmp database.
+
+    Like who(1), only user-process records with a non-empty user name whose
+    session process is still alive count; entries left behind by a killed
+    sshd or terminal multiplexer are ignored.
+
+    Returns:
+        List[str]: User name of every login session, duplicates included.
+
+    Raises:
+        OSError: If the utmp file cannot be read.
+    """
+    with open(UTMP_FILE, 'rb') as f:
+        data = f.read()
+    # Ignore a trailing partial record, e.g. one being written concurrently
+    data = data[:len(data) - len(data) % UTMP_RECORD.size]
+    return [
+        fields[4].split(b'\0', 1)[0].decode('utf-8', errors='replace')
+        for fields in UTMP_RECORD.iter_unpack(data)
+        if fields[0] == UTMP_USER_PROCESS
+        and fields[4][:1] not in (b'', b'\0')
+        and is_process_running(fields[1])
+    ]
+
+
 def check_system_activity(config: Config, logger: logging.Logger) -> bool:
     """Check for logged-in users on the system.
 
@@ -951,17 +1156,25 @@ def check_system_activity(config: Config, logger: logging.Logger) -> bool:
         return False
 
     try:
-        # Use subprocess.run instead of check_output for better control
-        result = subprocess.run(
-            [SYSTEM_COMMANDS['who']],
-            capture_output=True,
-            text=True,
-            timeout=5,  # Add timeout for safety
-            check=True
-        )
-        
-        who_output = result.stdout.strip()
-        users = [line.split()[0] for line in who_output.split('\n') if line.strip()]
+        try:
+            users = read_logged_in_users()
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{service_name}: Cannot read {UTMP_FILE} ({e}), falling back to who")
+            # Use subprocess.run instead of check_output for better control
+            result = subprocess.run(
+                [SYSTEM_COMMANDS['who']],
+                capture_output=True,
+                timeout=5,  # Add timeout for safety
+                check=True
+            )
+
+            # Scan the raw output once; only the user names are decoded
+            users = [
+                match.decode('utf-8', errors='replace')
+                for match in WHO_USER_PATTERN.findall(result.stdout)
+            ]
+
         unique_users = list(set(users))  # Get unique users
         
         if unique_users:
@@ -994,7 +1207,7 @@ def check_system_activity(config: Config, logger: logging.Logger) -> bool:
         config.activity_history.add_entry(ActivityCheckResult(
             service_name=service_name,
             status=ServiceStatus.ERROR,
-            details=f"Command failed: {e.stderr}"
+            details=f"Command failed: {e.stderr.decode('utf-8', errors='replace') if e.stderr else ''}"
         ))
         return False
     except Exception as e:
@@ -1005,7 +1218,100 @@ def check_system_activity(config: Config, logger: logging.Logger) -> bool:
             details=f"Unexpected error: {str(e)}"
         ))
         return False
-    
+
+
+# Service checks polled on every monitoring cycle, in reporting order
+SERVICE_CHECKS = (
+    ("System Users", check_system_activity),
+    ("Jellyfin", check_jellyfin),
+    ("Sonarr", check_sonarr),
+    ("Radarr", check_radarr),
+    ("Nextcloud", check_nextcloud),
+    ("Raspberry Pi", check_raspberry_pi_activity),
+    ("Plex", check_plex),
+    ("Emby", check_emby),
+)
+
+
+# Checks that outlived monitoring.check_timeout, keyed by service name. A
+# running check cannot be cancelled, so it is not resubmitted until it ends.
+_overrunning_checks: Dict[str, Future] = {}
+
+
+def check_all_services(config: Config, logger: logging.Logger, executor: ThreadPoolExecutor) -> Dict[str, bool]:
+    """Runs all service checks concurrently.
+
+    The checks are independent and mostly network-bound, so the cycle takes
+    as long as the slowest check rather than the sum of all of them. If
+    monitoring.check_timeout is set, checks still running when it expires
+    are reported as inactive, like failed checks, and are not submitted
+    again until the overrunning call has returned.
+
+    Args:
+        config (Config): The configuration object.
+        logger (logging.Logger): The logger object.
+        executor (ThreadPoolExecutor): Executor used to run the checks.
+
+    Returns:
+        Dict[str, bool]: Activity status of each service, keyed by service name.
+    """
+    futures = {}
+    for service_name, check_func in SERVICE_CHECKS:
+        overrunning = _overrunning_checks.get(service_name)
+        if overrunning is not None:
+            if not overrunning.done():
+                continue
+            del _overrunning_checks[service_name]
+        futures[service_name] = executor.submit(check_func, config, logger)
+
+    wait(futures.values(), timeout=config.check_timeout)
+
+    activities = {}
+    for service_name, _ in SERVICE_CHECKS:
+        future = futures.get(service_name)
+        if future is None:
+            logger.warning(f"{service_name}: Previous check is still running; skipping this round")
+            activities[service_name] = False
+            continue
+        if not future.done():
+            _overrunning_checks[service_name] = future
+            logger.warning(
+                f"{service_name}: Check still running after {config.check_timeout}s; "
+                "treating as inactive until it returns"
+            )
+            activities[service_name] = False
+            continue
+        try:
+            activities[service_name] = future.result()
+        except Exception as e:
+            logger.error(f"{service_name}: Unexpected error during check - {e}")
+            activities[service_name] = False
+    return activities
+
+_uptime_fd: Optional[int] = None
+
+
+def get_uptime() -> float:
+    """Returns the system uptime in seconds.
+
+    /proc/uptime is opened once and re-read with pread at offset 0, which
+    regenerates its contents, so each call costs a single syscall. Only the
+    first field is parsed.
+
+    Returns:
+        float: Seconds since boot.
+
+    Raises:
+        IOError: If /proc/uptime cannot be read.
+        ValueError: If its contents cannot be parsed.
+    """
+    global _uptime_fd
+    if _uptime_fd is None:
+        _uptime_fd = os.open('/proc/uptime', os.O_RDONLY)
+        atexit.register(os.close, _uptime_fd)
+    return float(os.pread(_uptime_fd, 32, 0).split(b' ', 1)[0])
+
+
 def get_system_status(activities: Dict[str, bool], grace_period_end_time: Optional[float] = None) -> SystemStatus:
     """Returns the current system status.
 
@@ -1018,8 +1324,7 @@ def get_system_status(activities: Dict[str, bool], grace_period_end_time: Option
     """
     active_services = [service for service, is_active in activities.items() if is_active]
     try:
-        with open('/proc/uptime', 'r') as f:
-            uptime = float(f.read().split()[0])
+        uptime = get_uptime()
     except (IOError, ValueError) as e:
         logging.getLogger('autosuspend').error(f"Failed to read uptime: {e}")
         uptime = 0.0
@@ -1029,7 +1334,7 @@ def get_system_status(activities: Dict[str, bool], grace_period_end_time: Option
         last_check_time=datetime.now(),
         uptime=uptime,
         grace_period_active=grace_period_end_time is not None,
-        grace_period_remaining=grace_period_end_time - time.time() if grace_period_end_time else None,
+        grace_period_remaining=grace_period_end_time - time.monotonic() if grace_period_end_time else None,
         active_services=active_services
     )
 
@@ -1067,10 +1372,10 @@ def wait_for_services(config: Config, logger: logging.Logger, timeout: int = 300
         True if all services become available within the timeout, False otherwise.
     """
     logger.info(f"Waiting for enabled services to become available (timeout: {timeout} seconds)...")
-    start_time = time.time()
+    start_time = time.monotonic()
     unavailable_services = set()
 
-    while time.time() - start_time < timeout:
+    while time.monotonic() - start_time < timeout:
         health_status = config.check_service_health()
         currently_unavailable = {s for s, h in health_status.items() if not h}
 
@@ -1097,6 +1402,10 @@ def wait_for_services(config: Config, logger: logging.Logger, timeout: int = 300
 def suspend_system(config: Config, logger: logging.Logger) -> bool:
     """Suspends the system and sets a wake-up timer.
 
+    Callers are expected to have confirmed the system is idle just before
+    calling; a last activity check is repeated only after the wake timer
+    is set and filesystems are synced.
+
     Args:
         config (Config): The configuration object.
         logger (logging.Logger): The logger object.
@@ -1110,11 +1419,6 @@ def suspend_system(config: Config, logger: logging.Logger) -> bool:
             logger.error(f"Required script not found: {SYSTEM_COMMANDS['set_wakeup']}")
             return False
 
-        # Double-check Pi activity one last time
-        if check_raspberry_pi_activity(config, logger):
-            logger.info("Last-minute activity detected from Pi, aborting suspend")
-            return False
-
         # Verify system state before suspend
         if os.path.exists('/sys/power/state'):
             with open('/sys/power/state', 'r') as f:
@@ -1126,11 +1430,13 @@ def suspend_system(config: Config, logger: logging.Logger) -> bool:
         wake_timer_set = False
         for attempt in range(1, config.max_retries + 1):
             try:
-                result = subprocess.run(
-                    ['sudo', SYSTEM_COMMANDS['set_wakeup']],
-                    capture_output=True,
+                subprocess.run(
+                    SET_WAKEUP_ARGV,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=30,
+                    timeout=SUSPEND_COMMAND_TIMEOUT,
                     check=True
                 )
                 wake_timer_set = True
@@ -1149,31 +1455,27 @@ def suspend_system(config: Config, logger: logging.Logger) -> bool:
             logger.error("Failed to set wake-up timer after all attempts")
             return False
 
-        # Sync filesystems
-        try:
-            logger.info("Syncing filesystems...")
-            subprocess.run([SYSTEM_COMMANDS['sync']], timeout=30, check=True)
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-            logger.error(f"Failed to sync filesystems: {e}")
-            return False
+        # Sync filesystems with the sync(2) syscall rather than forking /bin/sync
+        logger.info("Syncing filesystems...")
+        os.sync()
 
-        # Final check for last-minute activity
-        activities = {
-            "System Users": check_system_activity(config, logger),
-            "Raspberry Pi": check_raspberry_pi_activity(config, logger)
-        }
-        if any(activities.values()):
+        # Final check for last-minute activity; stop at the first active source
+        if check_system_activity(config, logger) or check_raspberry_pi_activity(config, logger, fresh=True):
             logger.info("Activity detected during final check, aborting suspend")
             return False
 
         # Attempt to suspend
         try:
             logger.info("Initiating system suspend...")
-            result = subprocess.run(
-                ['sudo', SYSTEM_COMMANDS['systemctl'], 'suspend'],
-                capture_output=True,
+            # Only stderr is piped (for error reporting); stdin/stdout go to
+            # /dev/null so no pipe descriptors are held open across resume
+            subprocess.run(
+                SUSPEND_ARGV,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=30,
+                timeout=SUSPEND_COMMAND_TIMEOUT,
                 check=True
             )
             logger.info("System suspend command executed successfully")
@@ -1190,6 +1492,27 @@ def suspend_system(config: Config, logger: logging.Logger) -> bool:
         logger.exception("Suspend error details:")
         return False
     
+def is_process_running(pid: int) -> bool:
+    """Checks whether a process exists with a single kill(pid, 0) syscall.
+
+    Args:
+        pid (int): Process ID to check.
+
+    Returns:
+        bool: True if the process exists, False otherwise.
+    """
+    if pid <= 0:
+        # kill() would address a process group or every process instead
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    return True
+
 def check_single_instance() -> Optional[int]:
     """Ensures that only one instance of the script is running.
 
@@ -1197,18 +1520,27 @@ def check_single_instance() -> Optional[int]:
         Optional[int]: File descriptor of lock file if successful, None if already running.
     """
     lock_file = Path("/var/run/autosuspend.lock")
+    tmp_file = f"{lock_file}.{os.getpid()}"
     try:
-        # Open with exclusive creation flag
-        fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_RDWR)
-        # Write PID to lock file
-        os.write(fd, str(os.getpid()).encode())
+        # Write the PID to a private file, then hard-link it into place. The
+        # link fails if the lock exists, and other instances never observe
+        # a lock file whose PID has not been written yet.
+        fd = os.open(tmp_file, os.O_CREAT | os.O_TRUNC | os.O_RDWR, 0o644)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.link(tmp_file, lock_file)
+        except OSError:
+            os.close(fd)
+            raise
+        finally:
+            os.unlink(tmp_file)
         return fd
     except OSError:
         try:
             # Check if the process in the lock file is still running
             with open(lock_file, 'r') as f:
                 pid = int(f.read().strip())
-                if os.path.exists(f"/proc/{pid}"):
+                if is_process_running(pid):
                     print(f"Another instance is already running (PID: {pid}). Exiting.")
                     sys.exit(0)
                 else:
@@ -1258,6 +1590,10 @@ def setup_signal_handlers(config: Config, logger: logging.Logger, lock_fd: Optio
             logger.info("Configuration reloaded successfully")
         except Exception as e:
             logger.error(f"Failed to reload configuration: {e}")
+        # Re-check right away with the new settings. The event is set from a
+        # helper thread because the main thread may be interrupted while it
+        # holds the event's internal lock.
+        threading.Thread(target=wake_main_loop, daemon=True).start()
 
     # Register the signal handlers
     signal.signal(signal.SIGTERM, handle_shutdown)
@@ -1317,20 +1653,29 @@ def main() -> None:
     # Setup signal handlers
     setup_signal_handlers(config, logger, lock_fd)
 
+    # Size the shared HTTP connection pools from the configuration; this is
+    # read once at startup and not re-applied on reload
+    mount_http_adapter(HTTP_SESSION, config.http_pool_maxsize)
+
     logger.info("Starting system monitoring...")
 
     # Wait for services to become available at startup
     if not wait_for_services(config, logger, timeout=STARTUP_DELAY):
         logger.warning("Not all services became available within the startup delay. Continuing with monitoring...")
 
+    # One worker per service so a slow API never delays the others
+    executor = ThreadPoolExecutor(max_workers=len(SERVICE_CHECKS), thread_name_prefix='svc')
+
     current_status = None
     grace_period_end_time = None
-    last_health_check = 0
+    check_interval = config.check_interval
+    previous_active_services = frozenset()
+    last_health_check = float('-inf')  # Run the first health check immediately
     health_check_interval = 300  # 5 minutes
 
     while True:
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Periodic health check
             if current_time - last_health_check >= health_check_interval:
@@ -1341,17 +1686,20 @@ def main() -> None:
                     logger.warning(f"Services potentially unhealthy: {', '.join(unhealthy)}")
                 last_health_check = current_time
 
+            # Suspending is not allowed this soon after boot, so skip the
+            # service polls until minimum_uptime has passed
+            try:
+                uptime = get_uptime()
+            except (IOError, ValueError):
+                uptime = None
+            if uptime is not None and uptime < config.minimum_uptime:
+                remaining = config.minimum_uptime - uptime
+                logger.info(f"Uptime below minimum ({config.minimum_uptime}s). Skipping activity checks for {int(remaining)}s.")
+                interruptible_sleep(min(config.check_interval, remaining))
+                continue
+
             # Check all services
-            activities = {
-                "System Users": check_system_activity(config, logger),
-                "Jellyfin": check_jellyfin(config, logger),
-                "Sonarr": check_sonarr(config, logger),
-                "Radarr": check_radarr(config, logger),
-                "Nextcloud": check_nextcloud(config, logger),
-                "Raspberry Pi": check_raspberry_pi_activity(config, logger),
-                "Plex": check_plex(config, logger),
-                "Emby": check_emby(config, logger)
-            }
+            activities = check_all_services(config, logger, executor)
 
             log_status_summary(activities, logger)
             
@@ -1362,30 +1710,29 @@ def main() -> None:
             if not any(activities.values()):
                 if grace_period_end_time is None:
                     # Start grace period
-                    grace_period_end_time = time.time() + config.grace_period
+                    grace_period_end_time = time.monotonic() + config.grace_period
                     logger.info(f"All services idle. Starting {config.grace_period}s grace period.")
-                elif time.time() >= grace_period_end_time:
+                elif time.monotonic() >= grace_period_end_time:
                     logger.info("Grace period expired. Performing final activity check...")
                     
-                    # Final activity check with reduced scope
-                    final_check_activities = {
-                        "System Users": check_system_activity(config, logger),
-                        "Raspberry Pi": check_raspberry_pi_activity(config, logger)
-                    }
-
-                    if not any(final_check_activities.values()):
+                    # Final activity check with reduced scope; any single active
+                    # source aborts the suspend, so skip the remaining checks
+                    final_check_active = (
+                        check_system_activity(config, logger)
+                        or check_raspberry_pi_activity(config, logger, fresh=True)
+                    )
+
+                    if not final_check_active:
                         logger.info("System still idle after grace period. Initiating suspend...")
                         if suspend_system(config, logger):
                             logger.info("System suspended successfully.")
                             # Reset grace period and clear all API caches
                             grace_period_end_time = None
-                            for func in [check_jellyfin, check_sonarr, check_radarr, 
-                                       check_nextcloud, check_raspberry_pi_activity,
-                                       check_plex, check_emby]:
+                            for _, func in SERVICE_CHECKS:
                                 if hasattr(func, 'clear_cache'):
                                     func.clear_cache()
                             # Wait a bit longer after suspend
-                            time.sleep(60)
+                            interruptible_sleep(60)
                             continue
                         else:
                             logger.error("Failed to suspend system.")
@@ -1395,15 +1742,15 @@ def main() -> None:
                         grace_period_end_time = None
                 else:
                     # Still in grace period, check Raspberry Pi more frequently
-                    remaining = int(grace_period_end_time - time.time())
+                    remaining = int(grace_period_end_time - time.monotonic())
                     logger.info(f"Grace period active: {remaining}s remaining")
                     
                     # Quick check for Pi activity
-                    if check_raspberry_pi_activity(config, logger):
+                    if check_raspberry_pi_activity(config, logger, fresh=True):
                         logger.info("Activity detected from Pi during grace period. Aborting suspend.")
                         grace_period_end_time = None
                     else:
-                        time.sleep(min(config.grace_period_check_interval, remaining))
+                        interruptible_sleep(min(config.grace_period_check_interval, remaining))
                         continue
             else:
                 # System is active, reset grace period
@@ -1411,8 +1758,16 @@ def main() -> None:
                     logger.info("Activity detected. Resetting grace period.")
                     grace_period_end_time = None
 
-            # Regular check interval
-            time.sleep(config.check_interval)
+            # Regular check interval. While the same services stay active,
+            # back off additively up to max_check_interval; any change in
+            # the active set (including going idle) resets it.
+            active_services = frozenset(current_status.active_services)
+            if active_services and active_services == previous_active_services:
+                check_interval = min(config.max_check_interval, check_interval + config.check_interval)
+            else:
+                check_interval = config.check_interval
+            previous_active_services = active_services
+            interruptible_sleep(check_interval)
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt. Shutting down...")
@@ -1420,7 +1775,9 @@ def main() -> None:
         except Exception as e:
             logger.error(f"Unexpected error in main loop: {str(e)}")
             logger.exception("Error details:")
-            time.sleep(config.check_interval)
+            interruptible_sleep(config.check_interval)
+
+    executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     main()
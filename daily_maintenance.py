@@ -20,9 +20,26 @@ import aiofiles
 import aioshutil
 import json
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder; fall back to the stdlib encoder
+    orjson = None
 
 # Constants
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+COMMAND_CHECK_TIMEOUT = 30  # Seconds allowed for a single status-probe command
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+_SELF_PID = os.getpid()
+
+def _reset_self_pid() -> None:
+    """Refresh the cached PID in a forked child."""
+    global _SELF_PID
+    _SELF_PID = os.getpid()
+
+os.register_at_fork(after_in_child=_reset_self_pid)
+
 CONFIG_SCHEMA = {
     "type": "object",
     "required": ["logging", "maintenance"],
@@ -267,6 +284,23 @@ class BackupManager:
             return False
 
 # --- Metrics Export ---
+def _json_default(obj: Any) -> Any:
+    """Converts the dataclasses, datetimes and enums found in metrics for json.dumps."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def encode_metrics_line(record: Dict[str, Any]) -> bytes:
+    """Encodes a metrics record as one newline-terminated JSON line."""
+    if orjson is not None:
+        # orjson emits bytes directly and handles dataclasses, datetimes and enums natively
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=_json_default) + '\n').encode('utf-8')
+
 class MetricsExporter:
     def __init__(self, export_path: Optional[str], logger: logging.Logger):
         self.export_path = Path(export_path) if export_path else None
@@ -278,11 +312,12 @@ class MetricsExporter:
             return
 
         try:
-            async with aiofiles.open(self.export_path, 'a') as f:
-                await f.write(json.dumps({
-                    'timestamp': datetime.now().isoformat(),
-                    'metrics': metrics
-                }) + '\n')
+            line = encode_metrics_line({
+                'timestamp': datetime.now().isoformat(),
+                'metrics': metrics
+            })
+            async with aiofiles.open(self.export_path, 'ab') as f:
+                await f.write(line)
             self.logger.info(f"Metrics exported to {self.export_path}")
         except Exception as e:
             self.logger.error(f"Failed to export metrics: {e}")
@@ -294,26 +329,36 @@ class HealthChecker:
         self.logger = logger
 
     async def check_health(self) -> Dict[str, Any]:
-        health_data = {
-            'system': await self._check_system_health(),
-            'tasks': await self._check_task_health(),
-            'resources': await self._check_resource_health(),
-            'network': await self._check_network_health(),
-            'database': await self._check_database_health() if self.config.database else "Not Configured"
+        # The sections are independent, so probe them concurrently
+        probes = {
+            'system': self._check_system_health(),
+            'tasks': self._check_task_health(),
+            'resources': self._check_resource_health(),
+            'network': self._check_network_health()
         }
+        if self.config.database:
+            probes['database'] = self._check_database_health()
+        health_data = dict(zip(probes, await asyncio.gather(*probes.values())))
+        health_data.setdefault('database', "Not Configured")
         
         self.logger.info(f"Health Check Results: {health_data}")
         return health_data
     
     async def _check_system_health(self) -> Dict[str, bool]:
-        return {
-            "disk_space": check_disk_space(self.logger),
-            "system_load": check_system_load(self.logger),
-            "critical_services": check_critical_services(self.logger),
-            "memory_usage": check_memory_usage(self.logger),
-            "filesystem_health": check_filesystem_health(self.logger),
-            "system_temperature": check_system_temperature(self.logger)
+        checks = {
+            "disk_space": check_disk_space,
+            "system_load": check_system_load,
+            "critical_services": check_critical_services,
+            "memory_usage": check_memory_usage,
+            "filesystem_health": check_filesystem_health,
+            "system_temperature": check_system_temperature
         }
+        # The checks are blocking (file reads and subprocesses), so run them
+        # in worker threads instead of stalling the event loop one by one
+        results = await asyncio.gather(
+            *(asyncio.to_thread(check, self.logger) for check in checks.values())
+        )
+        return dict(zip(checks, results))
 
     async def _check_task_health(self) -> Dict[str, str]:
         # Placeholder for task-specific health checks (e.g., last successful run)
@@ -329,10 +374,11 @@ class HealthChecker:
             # Check if interface is up
             result = await asyncio.create_subprocess_exec(
                 'ip', 'link', 'show', interface,
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.DEVNULL
             )
-            stdout, stderr = await result.communicate()
+            stdout, _ = await result.communicate()
             if result.returncode != 0 or "state UP" not in stdout.decode():
                 self.logger.warning(f"Interface {interface} is not up.")
                 return False
@@ -340,10 +386,11 @@ class HealthChecker:
             # Check if interface has an IP address
             result = await asyncio.create_subprocess_exec(
                 'ip', 'addr', 'show', interface,
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.DEVNULL
             )
-            stdout, stderr = await result.communicate()
+            stdout, _ = await result.communicate()
             if result.returncode != 0 or not any(line.strip().startswith("inet ") for line in stdout.decode().splitlines()):
                 self.logger.warning(f"Interface {interface} has no IP address.")
                 return False
@@ -357,8 +404,9 @@ class HealthChecker:
     async def _check_network_health(self) -> Dict[str, bool]:
         results = {}
         if self.config.network_settings:
-            for interface in self.config.network_settings.get('allowed_interfaces', []):
-                results[interface] = await self._check_interface(interface)
+            interfaces = self.config.network_settings.get('allowed_interfaces', [])
+            statuses = await asyncio.gather(*(self._check_interface(interface) for interface in interfaces))
+            results = dict(zip(interfaces, statuses))
         else:
             self.logger.warning("Network settings not configured. Skipping network health check.")
         return results
@@ -435,14 +483,14 @@ class CircuitBreaker:
         self.threshold = threshold
         self.recovery_timeout = recovery_timeout
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic() of the last failure
         self.lock = asyncio.Lock()
 
     async def is_open(self) -> bool:
         async with self.lock:
             if self.failure_count >= self.threshold:
                 if self.last_failure_time:
-                    time_since_last_failure = (datetime.now() - self.last_failure_time).total_seconds()
+                    time_since_last_failure = time.monotonic() - self.last_failure_time
                     if time_since_last_failure < self.recovery_timeout:
                         return True
                     else:
@@ -453,7 +501,7 @@ class CircuitBreaker:
     async def record_failure(self):
         async with self.lock:
             self.failure_count += 1
-            self.last_failure_time = datetime.now()
+            self.last_failure_time = time.monotonic()
             
     async def record_success(self):
         async with self.lock:
@@ -932,12 +980,29 @@ def run_command(command: str, logger: logging.Logger, timeout: int = 300) -> boo
 def check_single_instance() -> None:
     """Check if another instance of the script is running."""
     script_name = Path(__file__).name
-    result = subprocess.run(['pgrep', '-f', script_name], capture_output=True, text=True)
-    pids = result.stdout.strip().split('\n')
-    if len([pid for pid in pids if pid and int(pid) != os.getpid()]) > 0:
+    if find_processes_by_cmdline(script_name.encode()):
         print(f"Another instance of {script_name} is already running. Exiting.")
         sys.exit(0)
 
+def find_processes_by_cmdline(pattern: bytes) -> List[int]:
+    """Return PIDs of other processes whose command line contains pattern, in one /proc walk."""
+    pids = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == _SELF_PID:
+                continue
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if pattern in cmdline:
+                pids.append(pid)
+    return pids
+
 async def update_packages(logger: logging.Logger) -> bool:
     """Update package lists and install updates."""
     try:
@@ -1038,8 +1103,11 @@ def check_critical_services(logger: logging.Logger, services: List[str] = ["ssh"
         try:
             result = subprocess.run(
                 ['systemctl', 'is-active', service],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
+                timeout=COMMAND_CHECK_TIMEOUT,
                 check=True
             )
             if result.stdout.strip() != "active":
@@ -1047,7 +1115,7 @@ def check_critical_services(logger: logging.Logger, services: List[str] = ["ssh"
                 all_services_running = False
             else:
                 logger.info(f"Service check passed: {service} is active")
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             logger.error(f"Failed to check service {service}: {e}")
             all_services_running = False
     return all_services_running
@@ -1096,9 +1164,12 @@ def check_filesystem_health(logger: logging.Logger) -> bool:
 
 # Pre and Post Maintenance Hooks
 class MaintenanceHooks:
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, parallel: bool = True):
         self.pre_hooks: List[callable] = []
         self.post_hooks: List[callable] = []
+        self.max_workers = max_workers
+        # Set parallel=False when pre-hooks depend on each other's side effects
+        self.parallel = parallel
         
     def add_pre_hook(self, hook: callable) -> None:
         self.pre_hooks.append(hook)
@@ -1106,16 +1177,22 @@ class MaintenanceHooks:
     def add_post_hook(self, hook: callable) -> None:
         self.post_hooks.append(hook)
         
+    @staticmethod
+    def _run_pre_hook(hook: callable, logger: logging.Logger) -> bool:
+        try:
+            return bool(hook(logger))
+        except Exception as e:
+            logger.error(f"Pre-hook failed: {e}")
+            return False
+
     def run_pre_hooks(self, logger: logging.Logger) -> bool:
-        success = True
-        for hook in self.pre_hooks:
-            try:
-                if not hook(logger):
-                    success = False
-            except Exception as e:
-                logger.error(f"Pre-hook failed: {e}")
-                success = False
-        return success
+        """Run all pre-hooks, concurrently unless disabled; every hook runs even if one fails."""
+        if not self.parallel or len(self.pre_hooks) < 2:
+            results = [self._run_pre_hook(hook, logger) for hook in self.pre_hooks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.pre_hooks))) as executor:
+                results = list(executor.map(lambda hook: self._run_pre_hook(hook, logger), self.pre_hooks))
+        return all(results)
         
     def run_post_hooks(self, logger: logging.Logger, status: MaintenanceStatus) -> None:
         for hook in self.post_hooks:
@@ -1157,15 +1234,20 @@ class NetworkStats:
 def get_network_stats(interface: str = "eth0") -> NetworkStats:
     """Get network activity statistics."""
     try:
-        with open(f"/sys/class/net/{interface}/statistics/tx_bytes", 'r') as f:
-            tx_bytes = int(f.read())
-        with open(f"/sys/class/net/{interface}/statistics/rx_bytes", 'r') as f:
-            rx_bytes = int(f.read())
-        with open(f"/sys/class/net/{interface}/statistics/tx_packets", 'r') as f:
-            tx_packets = int(f.read())
-        with open(f"/sys/class/net/{interface}/statistics/rx_packets", 'r') as f:
-            rx_packets = int(f.read())
-        return NetworkStats(tx_bytes, rx_bytes, tx_packets, rx_packets)
+        # /proc/net/dev has every counter for every interface, so one read
+        # replaces opening four separate sysfs statistics files
+        with open("/proc/net/dev", 'r') as f:
+            for line in f:
+                name, sep, counters = line.partition(':')
+                if sep and name.strip() == interface:
+                    fields = counters.split()
+                    return NetworkStats(
+                        bytes_sent=int(fields[8]),
+                        bytes_recv=int(fields[0]),
+                        packets_sent=int(fields[9]),
+                        packets_recv=int(fields[1])
+                    )
+        raise ValueError(f"Interface {interface} not found")
     except Exception as e:
         print(f"Failed to get network stats: {e}")
         return NetworkStats(0, 0, 0, 0)
@@ -1181,24 +1263,34 @@ def get_process_stats(pid: int = None) -> ProcessStats:
     """Get resource usage statistics for the current process."""
     try:
         if pid is None:
-            pid = os.getpid()
-        with open(f"/proc/{pid}/stat", 'r') as f:
-            stats = f.read().split()
-        with open(f"/proc/{pid}/status", 'r') as f:
-            status = {line.split(':', 1)[0]: line.split(':', 1)[1].strip() for line in f}
+            pid = _SELF_PID
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            stat = f.read()
+        # comm may contain spaces or parentheses; fields resume after the last ')'
+        stats = stat[stat.rindex(b')') + 2:].split()
+        rss_kb = threads = None
+        with open(f"/proc/{pid}/status", 'rb') as f:
+            # Only VmRSS and Threads are needed; stop once both have been seen
+            for line in f:
+                if line.startswith(b'VmRSS:'):
+                    rss_kb = int(line.split()[1])
+                elif line.startswith(b'Threads:'):
+                    threads = int(line.split()[1])
+                if rss_kb is not None and threads is not None:
+                    break
             
         # Get CPU time (utime + stime)
-        utime = int(stats[13])
-        stime = int(stats[14])
+        utime = int(stats[11])
+        stime = int(stats[12])
         
         # Convert jiffies to seconds
-        cpu_time = (utime + stime) / os.sysconf(os.sysconf_names['SC_CLK_TCK'])
+        cpu_time = (utime + stime) / CLK_TCK
         
         # Get memory usage
-        mem_bytes = int(status['VmRSS'].split()[0]) * 1024
+        mem_bytes = rss_kb * 1024
         
         # Get total memory (to calculate percentage)
-        with open('/proc/meminfo', 'r') as f:
+        with open('/proc/meminfo', 'rb') as f:
             mem_total_line = f.readline().split()
             mem_total = int(mem_total_line[1]) * 1024
             
@@ -1208,8 +1300,11 @@ def get_process_stats(pid: int = None) -> ProcessStats:
             cpu_percent=cpu_time,
             memory_percent=mem_percent,
             open_files=len(os.listdir(f"/proc/{pid}/fd")),
-            threads=int(status["Threads"])
+            threads=threads
         )
+    except FileNotFoundError:
+        # The process exited between lookups
+        return ProcessStats(0, 0, 0, 0)
     except Exception as e:
         print(f"Failed to get process stats: {e}")
         return ProcessStats(0, 0, 0, 0)
@@ -1236,19 +1331,22 @@ def check_system_temperature(logger: logging.Logger, max_temp: float = 80.0) ->
 # Backup Verification (System State Verification)
 def verify_system_state(logger: logging.Logger) -> bool:
     """Verify system is in a good state for maintenance."""
-    checks = {
-        "Disk Space": check_disk_space(logger),
-        "System Load": check_system_load(logger),
-        "Critical Services": check_critical_services(logger),
-        "Memory Usage": check_memory_usage(logger),
-        "Filesystem Health": check_filesystem_health(logger),
-        "System Temperature": check_system_temperature(logger)
-    }
+    # Cheapest first: in-process syscalls and small /proc or /sys reads run
+    # before the checks that spawn systemctl or fsck, and the first failure
+    # stops verification
+    checks = (
+        ("System Load", check_system_load),
+        ("Disk Space", check_disk_space),
+        ("Memory Usage", check_memory_usage),
+        ("System Temperature", check_system_temperature),
+        ("Critical Services", check_critical_services),
+        ("Filesystem Health", check_filesystem_health)
+    )
     
-    failed_checks = [check for check, status in checks.items() if not status]
-    if failed_checks:
-        logger.error(f"System checks failed: {', '.join(failed_checks)}")
-        return False
+    for check, check_func in checks:
+        if not check_func(logger):
+            logger.error(f"System check failed: {check}")
+            return False
     logger.info("System state verification passed")
     return True
     